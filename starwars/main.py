@@ -3,6 +3,7 @@ import os
 import random
 from pathlib import Path
 
+import numpy as np
 import pygame
 
 WIDTH, HEIGHT = 900, 600
@@ -92,48 +93,138 @@ class Laser(pygame.sprite.Sprite):
             self.kill()
 
 
-class ThrusterParticle(pygame.sprite.Sprite):
-    def __init__(self, position):
-        super().__init__()
-        self.image = pygame.Surface((14, 24), pygame.SRCALPHA)
-        core_color = random.choice(
-            [
-                (255, 200, 90, 210),
-                (140, 220, 255, 220),
-                (255, 120, 120, 200),
-            ]
-        )
-        pygame.draw.ellipse(
-            self.image,
-            core_color,
-            pygame.Rect(2, 2, 10, 20),
-        )
-        pygame.draw.ellipse(
-            self.image,
-            (50, 90, 160, 120),
-            pygame.Rect(0, 0, 14, 24),
-            2,
-        )
-        self.position = pygame.Vector2(position)
-        self.velocity = pygame.Vector2(
-            random.uniform(-45, 45), random.uniform(180, 260)
+THRUSTER_COLORS = [
+    (255, 200, 90, 210),
+    (140, 220, 255, 220),
+    (255, 120, 120, 200),
+]
+SPARK_COLORS = [
+    (255, 160, 40, 230),
+    (255, 240, 180, 220),
+    (255, 255, 240, 200),
+]
+
+
+def _thruster_sprite(core_color):
+    surf = pygame.Surface((14, 24), pygame.SRCALPHA)
+    pygame.draw.ellipse(surf, core_color, pygame.Rect(2, 2, 10, 20))
+    pygame.draw.ellipse(surf, (50, 90, 160, 120), pygame.Rect(0, 0, 14, 24), 2)
+    return surf
+
+
+def _spark_sprite(color):
+    surf = pygame.Surface((8, 8), pygame.SRCALPHA)
+    pygame.draw.circle(surf, color, (4, 4), 4)
+    pygame.draw.circle(surf, (255, 255, 255, 180), (4, 4), 2)
+    return surf
+
+
+class ParticleSystem:
+    """Pool of particles stored in NumPy arrays and updated in bulk.
+
+    Each particle has a position, velocity, life, timer and a style index into
+    a table of pre-faded sprites, so drawing is a single ``blits`` call.
+    """
+
+    FADE_STEPS = 16
+
+    def __init__(self, capacity=8192):
+        self.capacity = capacity
+        self.count = 0
+        self.position = np.zeros((capacity, 2), dtype=np.float32)
+        self.velocity = np.zeros((capacity, 2), dtype=np.float32)
+        self.life = np.ones(capacity, dtype=np.float32)
+        self.timer = np.zeros(capacity, dtype=np.float32)
+        self.style = np.zeros(capacity, dtype=np.intp)
+        self.rng = np.random.default_rng()
+
+        base_sprites = [_thruster_sprite(color) for color in THRUSTER_COLORS]
+        self.thruster_styles = np.arange(len(THRUSTER_COLORS))
+        base_sprites += [_spark_sprite(color) for color in SPARK_COLORS]
+        self.spark_styles = np.arange(len(THRUSTER_COLORS), len(base_sprites))
+
+        self.sprites = []
+        for base in base_sprites:
+            for step in range(self.FADE_STEPS):
+                alpha = int(255 * step / (self.FADE_STEPS - 1))
+                faded = base.copy()
+                faded.fill((255, 255, 255, alpha), special_flags=pygame.BLEND_RGBA_MULT)
+                self.sprites.append(faded)
+        self.half_size = np.array(
+            [(base.get_width() / 2, base.get_height() / 2) for base in base_sprites],
+            dtype=np.float32,
         )
-        self.life = random.uniform(0.32, 0.52)
-        self.timer = 0.0
+
+    def emit(self, positions, velocities, lives, styles):
+        amount = min(len(lives), self.capacity - self.count)
+        if amount <= 0:
+            return
+        start, end = self.count, self.count + amount
+        self.position[start:end] = positions[:amount]
+        self.velocity[start:end] = velocities[:amount]
+        self.life[start:end] = lives[:amount]
+        self.timer[start:end] = 0.0
+        self.style[start:end] = styles[:amount]
+        self.count = end
+
+    def emit_thruster(self, position, amount=1):
+        rng = self.rng
+        jitter = rng.uniform((-12, -6), (12, 6), size=(amount, 2))
+        velocities = rng.uniform((-45, 180), (45, 260), size=(amount, 2))
+        lives = rng.uniform(0.32, 0.52, size=amount)
+        styles = rng.choice(self.thruster_styles, size=amount)
+        self.emit(np.asarray(position) + jitter, velocities, lives, styles)
+
+    def emit_burst(self, position, amount=48):
+        rng = self.rng
+        angles = rng.uniform(0, math.tau, size=amount)
+        speeds = rng.uniform(60, 320, size=amount)
+        velocities = np.column_stack((np.cos(angles), np.sin(angles))) * speeds[:, None]
+        lives = rng.uniform(0.25, 0.7, size=amount)
+        styles = rng.choice(self.spark_styles, size=amount)
+        positions = np.broadcast_to(np.asarray(position, dtype=np.float32), (amount, 2))
+        self.emit(positions, velocities, lives, styles)
 
     def update(self, dt):
-        self.timer += dt
-        self.position += self.velocity * dt
-        self.rect = self.image.get_rect(center=self.position)
-        fade = max(0.0, 1.0 - self.timer / self.life)
-        self.image.set_alpha(int(255 * fade))
-        if self.timer >= self.life:
-            self.kill()
+        n = self.count
+        if n == 0:
+            return
+        self.timer[:n] += dt
+        self.position[:n] += self.velocity[:n] * dt
+        alive = self.timer[:n] < self.life[:n]
+        alive_count = int(np.count_nonzero(alive))
+        if alive_count < n:
+            for array in (self.position, self.velocity, self.life, self.timer, self.style):
+                array[:alive_count] = array[:n][alive]
+            self.count = alive_count
+
+    def draw(self, surface):
+        n = self.count
+        if n == 0:
+            return
+        fade = 1.0 - self.timer[:n] / self.life[:n]
+        steps = np.clip(fade * (self.FADE_STEPS - 1), 0, self.FADE_STEPS - 1).astype(np.intp)
+        styles = self.style[:n]
+        corners = (self.position[:n] - self.half_size[styles]).astype(np.int32)
+        sprites = self.sprites
+        surface.blits(
+            [
+                (sprites[index], corner)
+                for index, corner in zip(
+                    (styles * self.FADE_STEPS + steps).tolist(), corners.tolist()
+                )
+            ],
+            doreturn=False,
+        )
+
+    def clear(self):
+        self.count = 0
 
 
 class Explosion(pygame.sprite.Sprite):
-    def __init__(self, position):
+    def __init__(self, position, particles):
         super().__init__()
+        particles.emit_burst(position)
         self.frames = []
         for radius in range(14, 70, 10):
             frame = pygame.Surface((radius * 2, radius * 2), pygame.SRCALPHA)
@@ -175,7 +266,7 @@ class Explosion(pygame.sprite.Sprite):
 
 
 class Enemy(pygame.sprite.Sprite):
-    def __init__(self, explosion_group, difficulty=1.0):
+    def __init__(self, explosion_group, particles, difficulty=1.0):
         super().__init__()
         scale = random.uniform(0.7, 1.15)
         width, height = int(74 * scale), int(64 * scale)
@@ -188,6 +279,7 @@ class Enemy(pygame.sprite.Sprite):
             random.uniform(-35, 35), random.uniform(140, 200) * difficulty
         )
         self.explosions = explosion_group
+        self.particles = particles
         self.health = 2 + int(difficulty * 0.6)
         self.radius = width * 0.42
         self.zigzag_phase = random.uniform(0, math.tau)
@@ -227,15 +319,15 @@ class Enemy(pygame.sprite.Sprite):
     def hit(self, damage=1):
         self.health -= damage
         if self.health <= 0:
-            self.explosions.add(Explosion(self.rect.center))
+            self.explosions.add(Explosion(self.rect.center, self.particles))
             self.kill()
 
 
 class Player(pygame.sprite.Sprite):
-    def __init__(self, laser_group, trail_group):
+    def __init__(self, laser_group, particles):
         super().__init__()
         self.lasers = laser_group
-        self.trails = trail_group
+        self.particles = particles
         self.base_image = self._create_image()
         self.image = self.base_image.copy()
         self.rect = self.image.get_rect(center=(WIDTH // 2, HEIGHT - 110))
@@ -252,6 +344,7 @@ class Player(pygame.sprite.Sprite):
         self.roll_amount = 0.0
         self.roll_target = 0.0
         self.trail_timer = 0.0
+        self.trail_rate = 28.0
 
     @staticmethod
     def _create_image():
@@ -339,13 +432,12 @@ class Player(pygame.sprite.Sprite):
         if keys[pygame.K_SPACE] or keys[pygame.K_LCTRL]:
             self.try_shoot()
 
-        self.trail_timer += dt
-        if self.trail_timer >= 0.035:
-            self.trail_timer = 0.0
-            thruster_offset = pygame.Vector2(0, 46)
-            jitter = pygame.Vector2(random.uniform(-12, 12), random.uniform(-6, 6))
-            spawn_point = self.position + thruster_offset + jitter
-            self.trails.add(ThrusterParticle(spawn_point))
+        self.trail_timer += dt * self.trail_rate
+        if self.trail_timer >= 1.0:
+            amount = int(self.trail_timer)
+            self.trail_timer -= amount
+            thruster = (self.position.x, self.position.y + 46)
+            self.particles.emit_thruster(thruster, amount)
 
     def try_shoot(self):
         if self._shoot_timer > 0:
@@ -408,8 +500,8 @@ def main():
     lasers = pygame.sprite.Group()
     enemies = pygame.sprite.Group()
     explosions = pygame.sprite.Group()
-    trails = pygame.sprite.Group()
-    player = Player(lasers, trails)
+    particles = ParticleSystem()
+    player = Player(lasers, particles)
     player_group = pygame.sprite.GroupSingle(player)
 
     score = 0.0
@@ -422,7 +514,7 @@ def main():
         lasers.empty()
         enemies.empty()
         explosions.empty()
-        trails.empty()
+        particles.clear()
         player.reset()
         score = 0.0
         spawn_timer = 0.0
@@ -458,14 +550,14 @@ def main():
             starfield.update(dt)
             player_group.update(dt, keys)
             lasers.update(dt)
-            trails.update(dt)
+            particles.update(dt)
             enemies.update(dt)
             spawn_timer += dt
             spawn_interval = max(0.38, 1.1 - score / 2400)
             difficulty = 1.0 + score / 780
             if spawn_timer >= spawn_interval:
                 spawn_timer = 0.0
-                enemies.add(Enemy(explosions, difficulty=difficulty))
+                enemies.add(Enemy(explosions, particles, difficulty=difficulty))
 
             collisions = pygame.sprite.groupcollide(enemies, lasers, False, True)
             for enemy, hits in collisions.items():
@@ -486,8 +578,8 @@ def main():
                 )
                 if impacts:
                     for enemy in impacts:
-                        explosions.add(Explosion(enemy.rect.center))
-                    explosions.add(Explosion(player.rect.center))
+                        explosions.add(Explosion(enemy.rect.center, particles))
+                    explosions.add(Explosion(player.rect.center, particles))
                     if not player.absorb_hit():
                         game_over = True
                         game_over_time = 0.0
@@ -498,7 +590,7 @@ def main():
         else:
             starfield.update(dt * 0.5)
             lasers.update(dt)
-            trails.update(dt)
+            particles.update(dt)
             game_over_time += dt
 
         explosions.update(dt)
@@ -506,7 +598,7 @@ def main():
         screen.fill((6, 8, 24))
         starfield.draw(screen)
         lasers.draw(screen)
-        trails.draw(screen)
+        particles.draw(screen)
         enemies.draw(screen)
         player_group.draw(screen)
         explosions.draw(screen)